@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
-from collections import Counter
-from random import randint
-from UNO.game_constants import CardType, EffectCategory, Color
+from random import choice
+from UNO.game_constants import CardType, EffectCategory, Color, COLOR_INDEX
 
 if TYPE_CHECKING:
     from UNO.card import Card
@@ -14,14 +13,12 @@ class AI:
     def auto_select_color(game_context) -> Color:
         """ Auto-select color based on current player's hand. """
         current_player = game_context.tm.get_current_player()
-        hand = current_player.hand.get_hand()
-        hand_colors = [card.color for card in hand if card.color is not Color.COLORLESS]
-        
-        if hand_colors:
-            # Choose most common color in hand
-            most_commmon_color = Counter(hand_colors).most_common(1)[0][0]
-            return most_commmon_color 
-        
+
+        # Hand keeps a running color tally, so no hand scan is needed here
+        most_common_color = current_player.hand.most_common_color()
+        if most_common_color is not None:
+            return most_common_color
+
         # Fallback to red
         return Color.RED
     
@@ -31,16 +28,28 @@ class AI:
             If None is returned, there are no legal moves.  """
 
         player = game_context.tm.get_current_player()
-        hand = player.hand.get_hand()
 
-        # Filter playable cards
-        playable_cards = [card for card in hand if game_context.engine.validate_play(card)]
+        # Filter playable cards - fetch the top card once and iterate the hand without copying
+        top_card = game_context.board.top_card
+        playable_cards = [card for card in player.hand.iter_hand()
+                          if game_context.engine.validate_play_fast(card, top_card)]
         
         if not playable_cards:
             return None  # No valid moves
-        
+
         return playable_cards
 
+    @staticmethod
+    def has_any_playable(game_context) -> bool:
+        """ Fast check whether the current player has at least one legal move.
+            Short-circuits on the first hit, so callers that only need a yes/no
+            (e.g. skip-turn checks in simulation loops) avoid validating the whole hand. """
+
+        player = game_context.tm.get_current_player()
+        top_card = game_context.board.top_card
+        engine = game_context.engine
+        return any(engine.validate_play_fast(card, top_card) for card in player.hand.iter_hand())
+
 
         #. TO FIX TYPE HINTING -->>>>>>>>>>>>>>>>>>>>>>>
     @staticmethod
@@ -56,56 +65,52 @@ class AI:
              """
 
         cards = playable_cards # Only contains valid plays and cannot be empty.
-        topcard = game_context.board.show_top_card_on_board()
+        topcard = game_context.board.top_card
         
         # ==== Bully Strategy ====
         # Try to stack a draw card for the next player on a recently played draw card
-        # -> Step 1: Check if attribute exists for Card (not for Number cards)
-        if topcard is not None: # Requires None check for hasattr       
-            if hasattr(topcard, "effect_types"):  
-                # -> Step 2: Check if card contains DRAW category (default: +2 and +4 cards)
-                if EffectCategory.DRAW in topcard.effect_types:
-                    try:
-                        stackable_draw_cards_list: list[Card] = [card for card in cards if EffectCategory.DRAW in card.effect_types]
-                        random_int = randint(0, len(stackable_draw_cards_list) - 1)
-                        stackable_draw_card: Card = stackable_draw_cards_list[random_int]
-                        return stackable_draw_card
-                    except ValueError:
-                        # Empty list, no cards to play.
-                        pass
+        # -> Step 1: Check if card contains DRAW category (default: +2 and +4 cards)
+        # Every Card declares effect_types (Number cards hold an empty set), so no hasattr guard needed
+        if topcard is not None and EffectCategory.DRAW in topcard.effect_types:
+            stackable_draw_cards_list: list[Card] = [card for card in cards if EffectCategory.DRAW in card.effect_types]
+            if stackable_draw_cards_list:
+                return choice(stackable_draw_cards_list)
 
         # ==== Prevent Final Draw Strategy ====
         # Try to avoid having ACTION/WILD as last card to prevent potential draw next turn
         # -> Step 1: Check if this rule is active
-        if not game_context.rules.ALLOW_FINAL_SPECIAL_CARD:
-            card_type_count = Counter(card.card_type for card in cards)
-            number_cards = [card for card in cards if card.card_type == CardType.NUMBER]
-            # -> Step 2: Check if 1 number card is one of the 2 final TYPES of cards
-            if len(number_cards) == 1 and sum(card_type_count.values()) == 2:
-                non_number_cards = [card for card in cards if card.card_type != CardType.NUMBER]
-                
-                # -> Step 3: Random select from list
-                if non_number_cards:
-                    random_int = randint(0, len(non_number_cards) - 1)
-                    non_number_card = non_number_cards[random_int]
-                    return non_number_card
+        # -> Step 2: Check the cheap length condition first - only a 2 card hand can match
+        if not game_context.rules.ALLOW_FINAL_SPECIAL_CARD and len(cards) == 2:
+            # Single scan instead of a Counter plus two filter passes over the same cards
+            number_card_count = 0
+            non_number_cards = []
+            for card in cards:
+                if card.card_type is CardType.NUMBER:
+                    number_card_count += 1
+                else:
+                    non_number_cards.append(card)
+            # -> Step 3: Check if 1 number card is one of the 2 final cards, then select
+            if number_card_count == 1 and non_number_cards:
+                return choice(non_number_cards)
         
         # ==== MAIN Strategy ====
         # Play the most common color card
-        # ->  Step 1: Count most common color
-        color_count = Counter(card.color for card in cards)        
-        most_common_color: Color = color_count.most_common(1)[0][0]
+        # ->  Step 1: Bucket the cards per color in a single pass (replaces Counter + re-filter)
+        color_buckets: list[list] = [[], [], [], []]
+        for card in cards:
+            index = COLOR_INDEX.get(card.color)
+            if index is not None:
+                color_buckets[index].append(card)
+
+        # -> Step 2: Grab the bucket of the most common color
+        most_common_cards = max(color_buckets, key=len)
 
-        # -> Step 2: Ceate list with the cards with most common color
-        most_common_cards = [common_card for common_card in cards if common_card.color == most_common_color]
-        
         # -> Step 3: Random select from list
         if most_common_cards:
-            random_int = randint(0, len(most_common_cards) - 1)
-            return most_common_cards[random_int]
+            return choice(most_common_cards)
         
         # Defensive fallback: play any card
-        return cards[randint(0, len(cards) - 1)]
+        return choice(cards)
 
 
 
@@ -1,3 +1,4 @@
+from weakref import WeakSet
 from UNO.card import Card
 from UNO.game_constants import GameEvent
 
@@ -10,40 +11,61 @@ class Board():
 
     def __init__(self):
         self._cards_on_board = []
-        self._observers = []
+        # Cached top card, kept in sync by every mutation: validation reads it on
+        # each candidate card, so it is one attribute load instead of an index check
+        self._top_card: Card | None = None
+        # Per-event observer buckets (GameEvent -> WeakSet); see Deck for rationale
+        self._observers = {}
+
+    @property
+    def top_card(self) -> Card | None:
+        """ The card on top of the board, or None while the board is empty. """
+        return self._top_card
 
     def add_card_to_board(self, card: Card):
         """ Add card to the board. """
         self._cards_on_board.append(card)
-        # Observer logic
-        self.notify_observers(GameEvent.ADD_CARD_TO_BOARD, {'card': card})
+        self._top_card = card
+        # Observer logic - skip payload construction when nobody subscribed
+        if self._observers.get(GameEvent.ADD_CARD_TO_BOARD):
+            self.notify_observers(GameEvent.ADD_CARD_TO_BOARD, {'card': card})
         
     def get_board(self):
-        """ Returns a (safe) copy of the board. """
+        """ Returns a (safe) snapshot copy of the board.
+            Only use when the caller needs to keep the list around. """
         return self._cards_on_board.copy()
+
+    def iter_board(self):
+        """ Read-only iteration over the board, without the defensive copy of get_board. """
+        return iter(self._cards_on_board)
     
     def show_top_card_on_board(self) -> Card | None:
-        """ Used to return the top card on the board, else return a None. """
-        try:
-            return self._cards_on_board[-1]
-        except IndexError:
-            return None
+        """ Used to return the top card on the board, else return a None.
+            Kept for existing callers; reads the maintained cache instead of indexing. """
+        return self._top_card
     
     def clear_all_except_last(self) -> list:
-        """ Clears the board except for the last card. 
+        """ Clears the board except for the last card.
             Returns all cleared cards for recycling. """
-        last_card: object = self.show_top_card_on_board()
-        cards_to_recycle = [card for card in self._cards_on_board if card != last_card]
+        if not self._cards_on_board:
+            return []
+        # Slice instead of filtering on (in)equality: one memcopy, and no false drops
+        # if two cards ever compared equal
+        last_card: Card = self._cards_on_board[-1]
+        cards_to_recycle = self._cards_on_board[:-1]
         self._cards_on_board = [last_card]
-        # Observer logic
-        self.notify_observers(GameEvent.BOARD_CLEARED, {'board_cards': self._cards_on_board})
+        # Observer logic - skip payload construction when nobody subscribed
+        if self._observers.get(GameEvent.BOARD_CLEARED):
+            self.notify_observers(GameEvent.BOARD_CLEARED, {'board_cards': self._cards_on_board})
         return cards_to_recycle
     
-    def subscribe(self, observer):
-        """ Subscribe as observer. """
-        self._observers.append(observer)
+    def subscribe(self, observer, events=None):
+        """ Subscribe as observer, optionally for a specific set of events only.
+            Set semantics make repeat subscriptions idempotent - no double-fired events. """
+        for event in (events if events is not None else GameEvent):
+            self._observers.setdefault(event, WeakSet()).add(observer)
 
     def notify_observers(self, event, data):
         """ Notify all subscribed observers """
-        for observer in self._observers:
+        for observer in tuple(self._observers.get(event, ())):
             observer.on_game_event(event, data)
\ No newline at end of file
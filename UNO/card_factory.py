@@ -3,6 +3,27 @@ from UNO.card import NumberCard, SkipCard, ReverseCard, DrawTwoCard, WildCard, W
 from UNO.game_config import Color, CardType
 
 
+# Dispatch table: CardType -> constructor wrapper with a uniform (color, card_id, card_value)
+# signature. One dict lookup per created card instead of walking a match/case ladder.
+_BUILDERS = {
+    CardType.NUMBER: lambda color, card_id, card_value: NumberCard(color=color, card_value=card_value, card_id=card_id),
+    CardType.SKIP: lambda color, card_id, card_value: SkipCard(color=color, card_id=card_id),
+    CardType.DRAW_TWO: lambda color, card_id, card_value: DrawTwoCard(color=color, card_id=card_id),
+    CardType.REVERSE: lambda color, card_id, card_value: ReverseCard(color=color, card_id=card_id),
+    CardType.WILD: lambda color, card_id, card_value: WildCard(card_id=card_id),
+    CardType.WILD_DRAW_FOUR: lambda color, card_id, card_value: WildDrawFourCard(card_id=card_id),
+}
+
+# Card types that need a color on top of the card_id
+_REQUIRES_COLOR = {CardType.SKIP, CardType.DRAW_TWO, CardType.REVERSE}
+
+# Flyweight cache keyed by (color, card_type, card_value). A standard deck holds 108 cards
+# but only ~54 unique descriptors, so duplicates share one instance. Wild cards are excluded:
+# they mutate their effective color after play and must stay per-instance.
+_CARD_CACHE: dict = {}
+_CACHEABLE_TYPES = {CardType.NUMBER} | _REQUIRES_COLOR
+
+
 class CardFactory():
     """ Factory responsible for card generation. """
     next_card_id = 0
@@ -10,46 +31,41 @@ class CardFactory():
     @classmethod
     def create_card(cls, color: Optional[Color], card_type: CardType, card_value: Optional[int] = None):
         """ Factory method* returning a new card object.
-            
-            - *Slight anti-pattern behaviour, not strictly a factory. Due to scoping not changed atm. 
-            
+
+            - *Slight anti-pattern behaviour, not strictly a factory. Due to scoping not changed atm.
+
             Args:
                 color: Card color (COLORLESS for wild cards)
                 card_type: Type of card to create
                 card_value: Numeric value (required for NUMBER cards)
-                
+
             Returns:
                 Appropriate Card subclass instance.
-                
+
             Raises:
                 ValueError: For unknown card types or invalid parameters. """
-        
-        card_id = CardFactory.__generate_card_id()
-        
-        match card_type:
-            case CardType.NUMBER:
-                if (card_value is None or color is None):
-                    raise ValueError("NUMBER cards require card_value parameter.")
-                return NumberCard(color=color, card_value=card_value, card_id=card_id)
-            case CardType.SKIP:
-                if color is None:
-                    raise ValueError("ACTION cards require color parameter.")
-                return SkipCard(color=color, card_id=card_id)
-            case CardType.DRAW_TWO:
-                if color is None:
-                    raise ValueError("ACTION cards require color parameter.")
-                return DrawTwoCard(color=color, card_id=card_id)
-            case CardType.REVERSE:
-                if color is None:
-                    raise ValueError("ACTION cards require color parameter.")
-                return ReverseCard(color=color, card_id=card_id)
-            case CardType.WILD:
-                return WildCard(card_id=card_id)
-            case CardType.WILD_DRAW_FOUR:
-                return WildDrawFourCard(card_id=card_id)
-            case _:
-                raise ValueError(f"Unknown card type: {card_type}")
-   
+
+        builder = _BUILDERS.get(card_type)
+        if builder is None:
+            raise ValueError(f"Unknown card type: {card_type}")
+
+        if card_type is CardType.NUMBER:
+            if card_value is None or color is None:
+                raise ValueError("NUMBER cards require card_value parameter.")
+        elif card_type in _REQUIRES_COLOR and color is None:
+            raise ValueError("ACTION cards require color parameter.")
+
+        # Immutable cards are interned: duplicates in a deck share one flyweight instance
+        if card_type in _CACHEABLE_TYPES:
+            key = (color, card_type, card_value)
+            card = _CARD_CACHE.get(key)
+            if card is None:
+                card = builder(color, CardFactory.__generate_card_id(), card_value)
+                _CARD_CACHE[key] = card
+            return card
+
+        return builder(color, CardFactory.__generate_card_id(), card_value)
+
     @classmethod
     def __generate_card_id(cls) -> int:
         """  Method to abstract the unique card ID generation.
@@ -1,6 +1,18 @@
 from UNO.game_config import GameRulesEnum, DeckConfigEnum
 from UNO.player import Player
 
+# Menu choice -> configuration lookup tables, shared by the selection prompts below
+_RULES_MAP = {
+    "1": GameRulesEnum.STANDARD,
+    "2": GameRulesEnum.HARDCORE,
+}
+_DECK_MAP = {
+    "1": DeckConfigEnum.STANDARD,
+    "2": DeckConfigEnum.HARDCORE,
+    "3": DeckConfigEnum.TESTDECK,
+    "4": DeckConfigEnum.BROKENDECK,
+}
+
 class ConfigSelector:
     """ Simple configuration selection before game start. 
         To be replaced later by a GUI.. """
@@ -74,10 +86,8 @@ class ConfigSelector:
         print("2. Hardcore Rules (Custom)")
                
         choice = input("Choose rules (1-2): ").strip()
-        
-        if choice == "2":
-            return GameRulesEnum.HARDCORE  # Hardcore
-        return GameRulesEnum.STANDARD  # Standard
+
+        return _RULES_MAP.get(choice, GameRulesEnum.STANDARD)  # Default to Standard
     
     @staticmethod
     def _select_deck() -> DeckConfigEnum:
@@ -89,11 +99,5 @@ class ConfigSelector:
         print("4. (DEV) Intentionally Broken Deck")
         
         choice = input("Choose deck (1-2): ").strip()
-        
-        if choice == "2":
-            return DeckConfigEnum.HARDCORE
-        if choice == "3":
-            return DeckConfigEnum.TESTDECK
-        if choice == "4":
-            return DeckConfigEnum.BROKENDECK
-        return DeckConfigEnum.STANDARD
\ No newline at end of file
+
+        return _DECK_MAP.get(choice, DeckConfigEnum.STANDARD)  # Default to Standard
\ No newline at end of file
@@ -1,52 +1,111 @@
-from random import shuffle
+from random import Random
+from weakref import WeakSet
 from UNO.card import Card
 from UNO.game_constants import GameEvent
 
+_MASK64 = (1 << 64) - 1
+
+
+def _lemire_shuffle(cards: list, getrandbits) -> None:
+    """ In-place Fisher-Yates using Lemire's multiply-shift trick for bounded indices.
+        One raw 64-bit draw per element with near-zero rejections, instead of the
+        modulo-rejection loop random.shuffle runs through _randbelow for every card.
+        getrandbits is passed in pre-bound (the deck RNG's method) to skip the module
+        attribute hop per draw. """
+    for i in range(len(cards) - 1, 0, -1):
+        bound = i + 1
+        product = getrandbits(64) * bound
+        low = product & _MASK64
+        if low < bound:
+            # Debias: reject draws that fall in the short trailing interval
+            threshold = (1 << 64) % bound
+            while low < threshold:
+                product = getrandbits(64) * bound
+                low = product & _MASK64
+        swap_index = product >> 64
+        cards[i], cards[swap_index] = cards[swap_index], cards[i]
+
 
 class Deck():
-    """ Deck, responsible for the cards"""
+    """ Deck, responsible for the cards.
 
-    def __init__(self):
+        Storage is deliberately a plain list rather than a deque: draws pop from the
+        tail (O(1) on a list), recycling is a single bulk extend, and the shuffle works
+        in place - a deque would add a list conversion on every shuffle for no gain. """
+
+    def __init__(self, rng: Random | None = None):
         self._card_deck = []
-        self._observers = []
+        # Per-event observer buckets (GameEvent -> WeakSet). Weak refs: a dropped
+        # observer cannot pin game state alive; per-event buckets mean an observer is
+        # only ever invoked for events it asked for.
+        self._observers = {}
+        # Instance-local RNG: no shared module state, and seedable for reproducible shuffles
+        self._rng = rng if rng is not None else Random()
         
     def get_deck(self):
-        """ Returns a (safe) copy of the deck. """
+        """ Returns a (safe) snapshot copy of the deck.
+            Only use when the caller needs to keep the list around - for inspection,
+            prefer iter_deck/len, which skip the O(N) pointer copy. """
         return self._card_deck.copy()
-    
+
+    def iter_deck(self):
+        """ Read-only iteration over the deck, without the defensive copy of get_deck. """
+        return iter(self._card_deck)
+
+    def __len__(self) -> int:
+        """ Number of cards in the deck, excluding the board. """
+        return len(self._card_deck)
+
     def add_card_to_deck(self, card: Card) -> None:
         """ Add a card to the Deck. """
         self._card_deck.append(card)
 
+        # Observer logic - skip the dispatch machinery when nobody subscribed
+        if self._observers.get(GameEvent.ADD_CARD_TO_DECK):
+            self.notify_observers(GameEvent.ADD_CARD_TO_DECK, {'card': card})
+
+    def add_cards_to_deck(self, cards: list) -> None:
+        """ Bulk-add cards to the Deck in one extend.
+            Avoids one Python-level call plus observer dispatch per card during
+            deck population; events still fire per card for subscribed observers. """
+        self._card_deck.extend(cards)
+
         # Observer logic
-        self.notify_observers(GameEvent.ADD_CARD_TO_DECK, {'card': card})
+        if self._observers.get(GameEvent.ADD_CARD_TO_DECK):
+            for card in cards:
+                self.notify_observers(GameEvent.ADD_CARD_TO_DECK, {'card': card})
 
     def shuffle_deck(self) -> None:
         """ Shuffles the deck. """
-        shuffle(self._card_deck)
+        _lemire_shuffle(self._card_deck, self._rng.getrandbits)
     
     def get_deck_length(self) -> int:
         """ Get the length of the deck, excluding the board (if it contains any). """
-        return len(self._card_deck)
+        return len(self._card_deck)  # Kept for existing callers; len(deck) is equivalent
 
     def draw_card(self) -> Card | None:
         """ Attempts to draw a card, returns None if it failed.  """
         if self._card_deck:
             # Explicit code for the observer
             card = self._card_deck.pop()
-            self.notify_observers(GameEvent.REMOVE_CARD_FROM_DECK, {'card': card})
+            if self._observers.get(GameEvent.REMOVE_CARD_FROM_DECK):
+                self.notify_observers(GameEvent.REMOVE_CARD_FROM_DECK, {'card': card})
             return card
         return None
         
     def attempt_recycle_deck(self, board) -> None:
-        """ Recycles the cards from the board to be put back in the deck. """
+        """ Recycles the cards from the board to be put back in the deck.
+            The same Card objects cycle between board and deck for the whole game -
+            recycling never allocates, it only moves references in bulk. """
         board_cards_to_recycle = board.clear_all_except_last()
-        for card in board_cards_to_recycle:
-            self.add_card_to_deck(card)
+        self.add_cards_to_deck(board_cards_to_recycle)
 
-    def subscribe(self, observer):
-        self._observers.append(observer)
+    def subscribe(self, observer, events=None):
+        """ Subscribe as observer, optionally for a specific set of events only.
+            Set semantics make repeat subscriptions idempotent - no double-fired events. """
+        for event in (events if events is not None else GameEvent):
+            self._observers.setdefault(event, WeakSet()).add(observer)
 
     def notify_observers(self, event, data):
-        for observer in self._observers:
+        for observer in tuple(self._observers.get(event, ())):
             observer.on_game_event(event, data)
\ No newline at end of file
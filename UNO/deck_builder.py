@@ -1,3 +1,4 @@
+from itertools import repeat
 from UNO.deck import Deck
 from UNO.card_factory import CardFactory
 from UNO.game_config import Color, CardType, DeckConfiguration
@@ -6,6 +7,13 @@ from UNO.game_config import Color, CardType, DeckConfiguration
 class DeckBuilder:
     """ DeckBuilder used for generating a deck with a given configuration. """
 
+    # Shared card pools per configuration class, built once and kept as immutable
+    # tuples. Cards are immutable apart from a wild card's chosen color, so a pool can
+    # be reused across game sessions (including restarts with the same configuration)
+    # instead of recreating ~108 objects per game. Card IDs stay stable, which helps
+    # debugging.
+    _deck_pools: dict = {}
+
     @staticmethod
     def create_deck() -> Deck:
         """ Create a new deck and returns the instantiation for further use. """
@@ -13,23 +21,55 @@ class DeckBuilder:
         return deck
 
     @staticmethod
-    def populate_deck(deck_config: DeckConfiguration, deck: Deck) -> None:
-        """ Populate a deck with cards as defined in the configuration. """
+    def _build_cards(deck_config: DeckConfiguration) -> list:
+        """ Create the full card list for a given configuration.
+            Repetition runs through itertools.repeat inside flat comprehensions, which
+            skips the per-iteration integer objects of the old range() inner loops. """
+        create_card = CardFactory.create_card
 
         # Generate x amount of number cards. x defined by frequency_of_number_cards.
-        for color in deck_config.DECK_COLORS:
-            for card_value, frequency in deck_config.FREQUENCY_OF_NUMBER_CARDS.items():
-                for _ in range(frequency):
-                    deck.add_card_to_deck(CardFactory.create_card(color=color, card_type=CardType.NUMBER, card_value=card_value))
-           
-           # Generate x amount of special cards. x defined by action_cards_per_color.
-            for card_type in deck_config.ACTION_CARDS:
-                for _ in range(deck_config.ACTION_CARDS_PER_COLOR):
-                    deck.add_card_to_deck(CardFactory.create_card(color=color, card_type=card_type))
-        
+        cards = [create_card(color=color, card_type=CardType.NUMBER, card_value=card_value)
+                 for color in deck_config.DECK_COLORS
+                 for card_value, frequency in deck_config.FREQUENCY_OF_NUMBER_CARDS.items()
+                 for _ in repeat(None, frequency)]
+
+        # Generate x amount of special cards. x defined by action_cards_per_color.
+        cards += [create_card(color=color, card_type=card_type)
+                  for color in deck_config.DECK_COLORS
+                  for card_type in deck_config.ACTION_CARDS
+                  for _ in repeat(None, deck_config.ACTION_CARDS_PER_COLOR)]
+
         # Generate x amount of wild cards. x defined by wild_cards_per_type.
-        for card_type in deck_config.WILD_CARDS:
-            for _ in range(deck_config.WILD_CARDS_PER_TYPE):
-                deck.add_card_to_deck(CardFactory.create_card(color=Color.COLORLESS, card_type=card_type))
-        
+        cards += [create_card(color=Color.COLORLESS, card_type=card_type)
+                  for card_type in deck_config.WILD_CARDS
+                  for _ in repeat(None, deck_config.WILD_CARDS_PER_TYPE)]
+
+        return cards
+
+    @staticmethod
+    def populate_deck(deck_config: DeckConfiguration, deck: Deck) -> None:
+        """ Populate a deck with freshly created cards as defined in the configuration.
+            Used mid-game (extra deck rule), where cards must not be shared with ones
+            already in play. """
+        deck.add_cards_to_deck(DeckBuilder._build_cards(deck_config))
+        deck.shuffle_deck()
+
+    @classmethod
+    def populate_deck_from_pool(cls, deck_config: DeckConfiguration, deck: Deck) -> None:
+        """ Populate a deck at game start, reusing the shared card pool for this
+            configuration. Builds the pool on first use; later games only reset the
+            wild cards' chosen color instead of recreating every card. """
+        pool = cls._deck_pools.get(deck_config)
+        if pool is None:
+            # Stored as a tuple: the prototype must never shrink or grow between games
+            pool = tuple(cls._build_cards(deck_config))
+            cls._deck_pools[deck_config] = pool
+
+        for card in pool:
+            if card.color is Color.COLORLESS:
+                card.effective_color = Color.COLORLESS  # Reset a previously chosen wild color
+                card._str_cache = None                  # ..and its rendered form
+
+        # add_cards_to_deck extends the deck's own list, so the pool can be passed as-is
+        deck.add_cards_to_deck(pool)
         deck.shuffle_deck()
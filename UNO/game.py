@@ -1,5 +1,6 @@
 import time
-from random import randrange
+from random import Random
+from weakref import WeakSet
 from UNO.player import Player
 from UNO.board import Board
 from UNO.card import Card
@@ -26,13 +27,19 @@ class Game:
     """
 
     def __init__(self, player_names: list[Player], rules: GameRulesEnum , deck_config: DeckConfigEnum):
-        self.__observers: list[GameObserver] = []
+        # Per-event observer buckets (GameEvent -> WeakSet of observers); weak refs
+        # so observers do not outlive their owner
+        self.__observers: dict[GameEvent, WeakSet[GameObserver]] = {}
         self.game_active = False
+        self._rng = Random()    # Instance-local RNG for AI pacing - keeps module random untouched
 
         # Get configuration
-        self.rules = rules.value                # Unpacked Enum of type GameRules - Tightly coupled in game mechanics
+        self.rules = rules.value.freeze()       # Immutable FrozenRules snapshot - tuple field reads in the card-effect hot path
         self.deck_config = deck_config.value    # Unpacked Enum of type DeckConfiguration - - Tightly coupled in game mechanics
         self.players = player_names             # List of Player objects
+
+        # Hoisted rule flag: read once here, checked on every special-card validation
+        self.allow_final_special_card = self.rules.ALLOW_FINAL_SPECIAL_CARD
         
         # Create an empty board & deck
         self.deck =  DeckBuilder.create_deck()
@@ -45,45 +52,63 @@ class Game:
         # Observer class
         self.gc = GameContext(self)
 
-        # Populate Deck with selected config
-        DeckBuilder.populate_deck(self.deck_config, self.deck)
+        # Populate Deck with selected config, reusing the shared card pool across sessions
+        DeckBuilder.populate_deck_from_pool(self.deck_config, self.deck)
         print(f"> Total deck length: {self.deck.get_deck_length()}")
 
         # Deal cards according to the rules
         self.engine.deal_cards(self.players, self.rules.STARTING_HAND_SIZE)
-        
-    def _handle_user_main_menu(self, player: Player) -> GameState | None:
-        """ Handle main menu interactions with clear escape paths. """
-        print("Options: [1] Draw card, [2] Play card, [3] Quit game")
 
-        action = input("Choose action (or 'b' to see options again)\nSelection: ")
+        # Main menu input -> handler dispatch table (shared across turns)
+        self._menu_dispatch = {
+            '1': Game._menu_draw,
+            '2': Game._menu_select,
+            '3': Game._menu_quit,
+            's': Game._menu_quit,
+            'b': Game._menu_refresh,
+        }
         
-        match action:
-            case '1':
-                self.engine.player_draw_card(player)
-                # self.engine.player_draw_card(player, self.rules.DRAW_PENALTY)
-                return GameState.END_TURN  # Return to menu after draw
-            case '2':
-                return GameState.CARD_SELECTION  # Transition to card selection
-            case '3' | 's':
-                print("Exiting game..")
-                self.stop_game()
-            case 'b':
-                return GameState.MAIN_MENU  # Refresh menu
-            case _:
-                print("Invalid option. Try again.")
-                return GameState.MAIN_MENU
+    def _handle_user_main_menu(self, player: Player) -> GameState | None:
+        """ Handle main menu interactions with clear escape paths.
+            Input is routed through the dispatch table built in __init__ - adding a
+            menu option means adding one handler plus one table entry. """
+        # One buffered stdout write: the menu rides along as the input() prompt
+        action = input("Options: [1] Draw card, [2] Play card, [3] Quit game\n"
+                       "Choose action (or 'b' to see options again)\nSelection: ")
+
+        handler = self._menu_dispatch.get(action, Game._menu_invalid)
+        return handler(self, player)
+
+    def _menu_draw(self, player: Player) -> GameState:
+        self.engine.player_draw_card(player)
+        # self.engine.player_draw_card(player, self.rules.DRAW_PENALTY)
+        return GameState.END_TURN  # Return to menu after draw
+
+    def _menu_select(self, player: Player) -> GameState:
+        return GameState.CARD_SELECTION  # Transition to card selection
+
+    def _menu_quit(self, player: Player) -> None:
+        print("Exiting game..")
+        self.stop_game()
+
+    def _menu_refresh(self, player: Player) -> GameState:
+        return GameState.MAIN_MENU  # Refresh menu
+
+    def _menu_invalid(self, player: Player) -> GameState:
+        print("Invalid option. Try again.")
+        return GameState.MAIN_MENU
     
-    def _get_card_from_user_input(self, player: Player) -> str | None:
-        """Handle user input collection with UI feedback. Returns None if user cancels."""
-        
-        print("\nCard Selection Mode")
-        print(player.hand.show_hand())
-        print(f"Top card: {self.board.show_top_card_on_board() or 'None (first play)'}")
-        print("Choose a card to play, or type 'b' to go back to main menu")
-        
-        action = input("Selection: ").strip()
-        
+    def _get_card_from_user_input(self, hand_display: str, top_card: Card | None) -> str | None:
+        """ Handle user input collection with UI feedback. Returns None if user cancels.
+            The hand/top-card display is rendered by the caller once per selection
+            session, so a retry only costs the blocking readline itself. """
+
+        # One buffered stdout write instead of four prints plus the prompt
+        action = input(f"\nCard Selection Mode\n{hand_display}\n"
+                       f"Top card: {top_card or 'None (first play)'}\n"
+                       "Choose a card to play, or type 'b' to go back to main menu\n"
+                       "Selection: ").strip()
+
         if action == 'b':
             return None  # Signal cancellation
         return action
@@ -101,9 +126,14 @@ class Game:
     
     def _human_card_selecion_loop(self, player: Player) -> GameState:
 
+        # The hand only changes once a play succeeds (which exits this loop), so the
+        # formatted hand and top card are computed once instead of per retry
+        hand_display = player.hand.show_hand()
+        top_card = self.board.show_top_card_on_board()
+
         while True:
             # Step 1: Get user input
-            user_input = self._get_card_from_user_input(player)
+            user_input = self._get_card_from_user_input(hand_display, top_card)
             if user_input is None:
                 return GameState.MAIN_MENU  # User cancelled
             
@@ -126,68 +156,97 @@ class Game:
     def _handle_human_turn(self, player: Player) -> None:
         """ Handle complete human turn with state management. """
         
-        game_state = GameState.MAIN_MENU
+        # Hoist the states and handlers touched on every pass into locals:
+        # one LOAD_FAST instead of LOAD_GLOBAL/LOAD_ATTR per iteration
+        end_turn = GameState.END_TURN
+        main_menu = GameState.MAIN_MENU
+        card_selection = GameState.CARD_SELECTION
+        handle_menu = self._handle_user_main_menu
+        handle_selection = self._human_card_selecion_loop
+
+        game_state = main_menu
         # Later introduce the validation mechanic beforehand here as well
         # Right now its more engaging to not do that to be honest
-        while game_state != GameState.END_TURN and self.game_active:
-            if game_state == GameState.MAIN_MENU:
-                game_state = self._handle_user_main_menu(player)
-            elif game_state == GameState.CARD_SELECTION:
-                game_state = self._human_card_selecion_loop(player)
+        while game_state is not end_turn and self.game_active:
+            if game_state is main_menu:
+                game_state = handle_menu(player)
+            elif game_state is card_selection:
+                game_state = handle_selection(player)
 
     def _handle_ai_turn(self, player: Player) -> None:
         """ Handle AI turn, skipping the human I/O parts. """
-        
-        time.sleep(randrange(1, 3))
-        
-        # Get a list of playable (validated) cards
+
+        # Compute the move inside the "thinking" pause instead of after it: the
+        # deadline is taken first, and only the delay left over is actually slept.
+        think_until = time.monotonic() + self._rng.randrange(1, 3)
+
+        # Get a list of playable (validated) cards and pick one
         playable_cards = AI.get_playable_cards(self)
-        if playable_cards is None:
+        selected_card = AI.pick_card(self, playable_cards) if playable_cards else None
+
+        remaining_delay = think_until - time.monotonic()
+        if remaining_delay > 0:
+            time.sleep(remaining_delay)
+
+        if selected_card is None:
             self.engine.player_draw_card(player)
             # self.engine.player_draw_card(player, self.rules.DRAW_PENALTY)
         else:
-            selected_card = AI.pick_card(self, playable_cards)
             self.engine.execute_card_play(player, selected_card)
 
     def play(self) -> None:
-        """ The main loop of the game. """
-        self.game_active = True
-        print("==> GAME STARTED! <== \n")
-        try:
-            while self.game_active:
-                player = self.tm.get_current_player()
-                print(f"\n<< It's {player.name}'s turn! >>")
-
-                if not player.is_human_controlled():
-                    self._handle_ai_turn(player)
-                else:
-                    self._handle_human_turn(player)
-
-                if self.game_active:
-                    self.engine.check_win_condition(player)
-                    # Signals to end current players turn
-                    self.tm.end_turn() 
-                
-                # To be replaced
-                # self.gc.print_complete_snapshot()
-
-        except KeyboardInterrupt:
-            print("\nGame interrupted by user. Exiting game...")
-            action = input("Type to stop: 's' or to continue: 'c': ")
-            if action == "c":
-                self.play()
-            if action != "c":
-                self.stop_game()     
+        """ The main loop of the game.
+            The interrupt handler restarts via the outer loop instead of calling play()
+            recursively, which kept every interrupted frame (and its locals) alive. """
+        # Hoisted collaborators for the turn loop - they never change mid-session
+        engine = self.engine
+        tm = self.tm
+
+        while True:
+            self.game_active = True
+            print("==> GAME STARTED! <== \n")
+            try:
+                while self.game_active:
+                    player = tm.get_current_player()
+                    print(f"\n<< It's {player.name}'s turn! >>")
+
+                    if not player.is_human_controlled():
+                        self._handle_ai_turn(player)
+                    else:
+                        self._handle_human_turn(player)
+
+                    if self.game_active:
+                        engine.check_win_condition(player)
+                        # Signals to end current players turn
+                        tm.end_turn()
+
+                    # To be replaced
+                    # self.gc.print_complete_snapshot()
+                return
+
+            except KeyboardInterrupt:
+                print("\nGame interrupted by user. Exiting game...")
+                action = input("Type to stop: 's' or to continue: 'c': ")
+                if action == "c":
+                    continue
+                self.stop_game()
+                return
 
     def stop_game(self) -> None:
         """Stop the game"""
         self.game_active = False
         
-    def subscribe(self, observer: GameObserver) -> None:
-        """ Subscribe as observer. """
-        self.__observers.append(observer)
+    def subscribe(self, observer: GameObserver, events=None) -> None:
+        """ Subscribe as observer, optionally for a specific set of events only.
+            Set semantics make repeat subscriptions idempotent - no double-fired events. """
+        for event in (events if events is not None else GameEvent):
+            self.__observers.setdefault(event, WeakSet()).add(observer)
+
+    def has_observers(self, event: GameEvent) -> bool:
+        """ Whether anyone subscribed to this event - lets callers skip building payloads. """
+        return bool(self.__observers.get(event))
     
     def notify_observers(self, event: GameEvent, data: dict[str, set]) -> None:
         """ Notify all subscribed observers """
-        for observer in self.__observers:
+        for observer in tuple(self.__observers.get(event, ())):
             observer.on_game_event(event, data)
@@ -1,8 +1,14 @@
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
 from enum import Enum
 from UNO.game_constants import Color, CardType
 
 
+# Allowed card types per deck section, built once at import instead of per validation call
+_VALID_ACTION_TYPES = frozenset({CardType.SKIP, CardType.DRAW_TWO, CardType.REVERSE})
+_VALID_WILD_TYPES = frozenset({CardType.WILD, CardType.WILD_DRAW_FOUR})
+
+
 class DeckConfiguration:
     """ Base configuration class for the deck configuration.
         Allows the user to configure custom decks, with basic game logic validation.
@@ -25,75 +31,69 @@ class DeckConfiguration:
     WILD_CARDS: List[CardType] = [CardType.WILD, CardType.WILD_DRAW_FOUR]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def validate_deckconfig(decktemplate) -> List[str]:
         """ Basic deck validation logic. Essential for when loading user configured decks. 
-            This configuration is little bit more elaborate than the rule validation, but still nothing fancy. """
+            This configuration is little bit more elaborate than the rule validation, but still nothing fancy. 
+            Memoized per enum member: the checks are deterministic for a given class-level
+            configuration, so repeated selection screens reuse the first result. """
         issues = []
         decktemplate = decktemplate.value
-        
+        # The sections always resolve through inheritance from this base class, so the
+        # old per-section hasattr guards were dead weight and have been dropped.
+
         # Validate FREQUENCY_OF_NUMBER_CARDS
-        if hasattr(decktemplate, 'FREQUENCY_OF_NUMBER_CARDS'):
-            freq_cards = decktemplate.FREQUENCY_OF_NUMBER_CARDS
-            if not isinstance(freq_cards, dict):
-                issues.append("FREQUENCY_OF_NUMBER_CARDS must be a dictionary")
-            else:
-                for card_value, frequency in freq_cards.items():
-                    # Validate card values are in valid range (0-9 for UNO)
-                    if not isinstance(card_value, int) or not (0 <= card_value):
-                        issues.append(f"Invalid card value: {card_value}. Must be positive integer")
-                    
-                    # Validate frequencies are positive integers
-                    if not isinstance(frequency, int) or frequency < 0:
-                        issues.append(f"Invalid frequency {frequency} for card {card_value}. Must be non-negative integer")
-        
+        freq_cards = decktemplate.FREQUENCY_OF_NUMBER_CARDS
+        if not isinstance(freq_cards, dict):
+            issues.append("FREQUENCY_OF_NUMBER_CARDS must be a dictionary")
+        else:
+            # Card values must be non-negative integers (0-9 for UNO)
+            issues.extend(f"Invalid card value: {card_value}. Must be positive integer"
+                          for card_value in freq_cards
+                          if not isinstance(card_value, int) or card_value < 0)
+            # Frequencies must be non-negative integers
+            issues.extend(f"Invalid frequency {frequency} for card {card_value}. Must be non-negative integer"
+                          for card_value, frequency in freq_cards.items()
+                          if not isinstance(frequency, int) or frequency < 0)
+
         # Validate ACTION_CARDS_PER_COLOR
-        if hasattr(decktemplate, 'ACTION_CARDS_PER_COLOR'):
-            action_per_color = decktemplate.ACTION_CARDS_PER_COLOR
-            if not isinstance(action_per_color, int) or action_per_color < 0:
-                issues.append(f"ACTION_CARDS_PER_COLOR must be non-negative integer, got: {action_per_color}")
-        
-        # Validate WILD_CARDS_PER_TYPE  
-        if hasattr(decktemplate, 'WILD_CARDS_PER_TYPE'):
-            wild_per_type = decktemplate.WILD_CARDS_PER_TYPE
-            if not isinstance(wild_per_type, int) or wild_per_type < 0:
-                issues.append(f"WILD_CARDS_PER_TYPE must be non-negative integer, got: {wild_per_type}")
-        
+        action_per_color = decktemplate.ACTION_CARDS_PER_COLOR
+        if not isinstance(action_per_color, int) or action_per_color < 0:
+            issues.append(f"ACTION_CARDS_PER_COLOR must be non-negative integer, got: {action_per_color}")
+
+        # Validate WILD_CARDS_PER_TYPE
+        wild_per_type = decktemplate.WILD_CARDS_PER_TYPE
+        if not isinstance(wild_per_type, int) or wild_per_type < 0:
+            issues.append(f"WILD_CARDS_PER_TYPE must be non-negative integer, got: {wild_per_type}")
+
         # Validate DECK_COLORS
-        if hasattr(decktemplate, 'DECK_COLORS'):
-            deck_colors = decktemplate.DECK_COLORS
-            if not isinstance(deck_colors, list) or len(deck_colors) == 0:
-                issues.append("DECK_COLORS must be non-empty list")
-            else:
-                for color in deck_colors:
-                    if not isinstance(color, Color):
-                        issues.append(f"Invalid color type: {color}. Must be Color enum value")
-        
+        deck_colors = decktemplate.DECK_COLORS
+        if not isinstance(deck_colors, list) or len(deck_colors) == 0:
+            issues.append("DECK_COLORS must be non-empty list")
+        else:
+            issues.extend(f"Invalid color type: {color}. Must be Color enum value"
+                          for color in deck_colors if not isinstance(color, Color))
+
         # Validate ACTION_CARDS
-        if hasattr(decktemplate, 'ACTION_CARDS'):
-            action_cards = decktemplate.ACTION_CARDS
-            if not isinstance(action_cards, list):
-                issues.append("ACTION_CARDS must be a list")
-            else:
-                valid_action_types = {CardType.SKIP, CardType.DRAW_TWO, CardType.REVERSE}
-                for card_type in action_cards:
-                    if not isinstance(card_type, CardType):
-                        issues.append(f"Invalid action card type: {card_type}. Must be CardType enum")
-                    elif card_type not in valid_action_types:
-                        issues.append(f"Invalid action card: {card_type}. Must be SKIP, DRAW_TWO, or REVERSE")
-        
+        action_cards = decktemplate.ACTION_CARDS
+        if not isinstance(action_cards, list):
+            issues.append("ACTION_CARDS must be a list")
+        else:
+            issues.extend(f"Invalid action card type: {card_type}. Must be CardType enum"
+                          if not isinstance(card_type, CardType)
+                          else f"Invalid action card: {card_type}. Must be SKIP, DRAW_TWO, or REVERSE"
+                          for card_type in action_cards if card_type not in _VALID_ACTION_TYPES)
+
         # Validate WILD_CARDS
-        if hasattr(decktemplate, 'WILD_CARDS'):
-            wild_cards = decktemplate.WILD_CARDS
-            if not isinstance(wild_cards, list):
-                issues.append("WILD_CARDS must be a list")
-            else:
-                valid_wild_types = {CardType.WILD, CardType.WILD_DRAW_FOUR}
-                for card_type in wild_cards:
-                    if not isinstance(card_type, CardType):
-                        issues.append(f"Invalid wild card type: {card_type}. Must be CardType enum")
-                    elif card_type not in valid_wild_types:
-                        issues.append(f"Invalid wild card: {card_type}. Must be WILD or WILD_DRAW_FOUR")
-        
+        wild_cards = decktemplate.WILD_CARDS
+        if not isinstance(wild_cards, list):
+            issues.append("WILD_CARDS must be a list")
+        else:
+            issues.extend(f"Invalid wild card type: {card_type}. Must be CardType enum"
+                          if not isinstance(card_type, CardType)
+                          else f"Invalid wild card: {card_type}. Must be WILD or WILD_DRAW_FOUR"
+                          for card_type in wild_cards if card_type not in _VALID_WILD_TYPES)
+
         return issues
     
 class StandardDeck(DeckConfiguration):
@@ -127,6 +127,22 @@ class IntentionalBrokenDeck(DeckConfiguration):
     WILD_CARDS: List[CardType] = [CardType.WILD, CardType.WILD_DRAW_FOUR]
 
 
+class FrozenRules(NamedTuple):
+    """ Immutable per-session snapshot of a GameRules class.
+        Field reads compile to indexed tuple access instead of walking the class MRO,
+        which matters because card effects check rules on every play. Field names and
+        order mirror the BASE RULES block in GameRules. """
+    FORCE_PLAY_IF_POSSIBLE: bool
+    ALLOW_MULTIPLE_DECKS: bool
+    STARTING_HAND_SIZE: int
+    ALLOW_FINAL_SPECIAL_CARD: bool
+    DRAW_PENALTY: int
+    TIMEOUT_SECONDS: int
+    STACKABLE_DRAW_CARDS: bool
+    WILD_CARD_ALLOW_PICK_COLOR: bool
+    SKIP_TURN_ON_DRAW: bool
+
+
 class GameRules:
     """ Default base game rule configuration class. Allows the user to configure custom rules, with some basic rule validation.
         Initially I wanted to load this configuration from a JSON, but I pivoted and settled for something hybrid. 
@@ -148,10 +164,18 @@ class GameRules:
     STACKABLE_DRAW_CARDS: bool = True           # CARD RULE: IF you can stack Draw X amount cards. Affects any card with EffectCategory: DRAW
     WILD_CARD_ALLOW_PICK_COLOR: bool = True     # CARD RULE: IF you can select a color after playing a WILD card
     SKIP_TURN_ON_DRAW: bool = False             # CARD RULE: IF a Draw Card (Action or WILD) skips next players turn. Affects any card with EffectCategory: DRAW
-    
+
+    @classmethod
+    def freeze(cls) -> FrozenRules:
+        """ Snapshot the effective rules (including subclass overrides) into a FrozenRules
+            tuple for the duration of a game session. """
+        return FrozenRules(**{field: getattr(cls, field) for field in FrozenRules._fields})
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def validate_rules(ruleset) -> List[str]:
         """ Basic rule set validation logic. Essential for when loading user configured rules.
+            Memoized per enum member, mirroring validate_deckconfig.
             Displayed at Config Selection to evaluate a (new) custom configuration. 
             This validation is a whole lot less extensive than the deck variant. 
             As such, this method is mostly used for demonstrative purposes.  """
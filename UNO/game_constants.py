@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum, auto
 
 class Color(Enum):
     """ Enums for a fixed type-safe value for colors"""
@@ -9,6 +9,12 @@ class Color(Enum):
     BLUE = "Blue"
     COLORLESS = "Colorless"
 
+# Fixed index per playable color, so tallies can use small fixed-size lists instead of
+# hashing enum members into dicts. COLORLESS is deliberately absent: wild cards never
+# count towards a color preference.
+COLOR_INDEX = {Color.RED: 0, Color.YELLOW: 1, Color.GREEN: 2, Color.BLUE: 3}
+PLAYABLE_COLORS = (Color.RED, Color.YELLOW, Color.GREEN, Color.BLUE)
+
 class CardType(Enum):
     """ Enums for a fixed type-safe value for CardTypeNames.
         Used for identifying cards in the game. """  
@@ -23,25 +29,29 @@ class CardType(Enum):
     CUSTOM_ACTION_CARD_Y = "Custom Y"
     CUSTOM_WILD_CARD_Z = "Custom Z"
 
-class GameState(Enum):
+class GameState(IntEnum):
     """ Enums for a fixed type-safe value for various menus
-        Used to switch between various screens within the game.  """
-    
-    MAIN_MENU = "Main Menu"
-    CARD_SELECTION = "Card Selection"
-    END_TURN = "End Turn"
-
-class GameEvent(Enum):
-    """ Enum events for game's Observer Pattern and for potential future multiplayer state management. """
-
-    CARD_PLAYED = "Card Played"
-    CARD_DRAWN = "Card Drawn"
-    ADD_CARD_TO_DECK = "Added Card To Deck"
-    ADD_CARD_TO_BOARD = "Added Card To Board"
-    REMOVE_CARD_FROM_DECK = "Remove Card From Deck"
-    PLAYER_TURN_CHANGED = "Player Turn Changed"
-    TURN_ORDER_CHANGED = "Turn Order Changed"
-    BOARD_CLEARED = "Board Cleared"
+        Used to switch between various screens within the game.
+        IntEnum: these are compared on every loop pass and never displayed,
+        so the cheaper int hash/compare wins over a readable value.  """
+
+    MAIN_MENU = auto()
+    CARD_SELECTION = auto()
+    END_TURN = auto()
+
+class GameEvent(IntEnum):
+    """ Enum events for game's Observer Pattern and for potential future multiplayer state management.
+        IntEnum: events are dispatched/compared far more often than rendered. """
+
+    CARD_PLAYED = auto()
+    CARD_DRAWN = auto()
+    CARDS_DRAWN_BULK = auto()   # One event for a whole multi-card draw (deal, penalties)
+    ADD_CARD_TO_DECK = auto()
+    ADD_CARD_TO_BOARD = auto()
+    REMOVE_CARD_FROM_DECK = auto()
+    PLAYER_TURN_CHANGED = auto()
+    TURN_ORDER_CHANGED = auto()
+    BOARD_CLEARED = auto()
     # Ideas I want to implement later for more robust event management:
     # UNO = "UNO"
     # GAME_START = "Game Started" 
@@ -50,14 +60,14 @@ class GameEvent(Enum):
     # GAME_WON = "Game Won"
     # CONFIG_CHANGED = "Game Configuration Changed"
 
-class EffectCategory(Enum):
+class EffectCategory(IntEnum):
     """ Enums for a fixed type-safe value for various special effects.
         Used to classify similar effects so game rules can be applied. 
         
         BE AWARE:
         This works for a small scope, but will get complex quickly as custom effects and rules increase. """
     
-    DRAW = "Draw"
-    COLOR_CHANGE = "Color Change"
-    TURN = "Turn"
-    END_TURN = "End Turn"
\ No newline at end of file
+    DRAW = auto()
+    COLOR_CHANGE = auto()
+    TURN = auto()
+    END_TURN = auto()
\ No newline at end of file
@@ -1,15 +1,39 @@
-from datetime import datetime
+from __future__ import annotations
+from functools import lru_cache
+from itertools import count
 from typing import TYPE_CHECKING
 from UNO.game_constants import CardType, GameEvent
-from UNO.player import Player
-from UNO.board import Board
-from UNO.card import Card
-from UNO.deck import Deck
 from UNO.deck_builder import DeckBuilder
 
+# Annotation-only imports: with lazy annotations these classes are never needed at
+# runtime here, so the modules stay off this module's import path
 if TYPE_CHECKING:
+    from UNO.player import Player
+    from UNO.board import Board
+    from UNO.card import Card
+    from UNO.deck import Deck
     from UNO.game import Game
 
+# Monotonic per-process event sequence. Orders events like the old per-event
+# datetime.now() did, without a clock_gettime syscall and datetime allocation each.
+_event_seq = count()
+
+
+@lru_cache(maxsize=4096)
+def _is_signature_match(card: Card, card_color, top_card: Card, top_color, wild_types: tuple) -> bool:
+    """ Pure color/number/wild signature match between a hand card and the top card.
+        Memoized: the same (card, top card, effective colors) combination is re-validated
+        many times while the board is unchanged (e.g. AI filtering its whole hand).
+        Deliberately excludes can_execute_effect: that check reads live state (hand
+        sizes, stacking rules against the current top card), so caching its result
+        would serve stale answers. Only the pure half of validate_play is memoized. """
+    if card_color is top_color:
+        return True     # Match by effective color
+    if card.card_type is CardType.NUMBER and card.card_value == top_card.card_value:
+        return True     # Match by number
+    return card.card_type in wild_types     # Match by Wild Card
+
+
 class GameEngine:
     """ Encapsulates game rules & core mechanics. 
 
@@ -18,33 +42,49 @@ class GameEngine:
         Currently, the card effect validation & execution is still encapsuilated in the card classes. This is due to an older
         refacator that hasn't been fully moved to the game engine, but for now I like to keep it in the card class.
         Due to the current CLI nature, it handles basic print messages, but that may change if I add a GUI. """
+
+    # Fixed attribute set - no per-instance __dict__, and typos on assignment fail loudly
+    __slots__ = ('_deck', '_board', '_game_context', '_wild_types')
+
     def __init__(self, deck: Deck, board: Board, game_context: 'Game'):
             self._deck = deck
             self._board = board
 
             # Only used when required to notify observers or access global state
-            self._game_context = game_context  
+            self._game_context = game_context
+
+            # Precomputed hashable view of the wild card types, used as part of the memo key.
+            # Frozenset: membership is a hash probe instead of a tuple scan. Not an int
+            # bitmask: CardType values are strings (the display/serialization contract),
+            # so there is no stable small-int to shift by, and the set holds 2 entries.
+            self._wild_types = frozenset(game_context.deck_config.WILD_CARDS)
+
+            # Drop memoized matches from any previous game session
+            _is_signature_match.cache_clear()
 
     def validate_play(self, card_to_validate: Card) -> bool:
         """" Method to validate whether the chosen card is a legal move. """
-        top_card_on_board: Card | None = self._board.show_top_card_on_board()
-        
+        # Attribute read of the maintained cache - no method call per validated card
+        top_card_on_board: Card | None = self._board.top_card
+        return self.validate_play_fast(card_to_validate, top_card_on_board)
+
+    def validate_play_fast(self, card_to_validate: Card, top_card_on_board: Card | None) -> bool:
+        """ Same validation as validate_play, but with the top card threaded in by the caller.
+            Lets callers that validate a whole hand fetch the top card once. """
         # Check if board is empty
         if top_card_on_board is None:
             return True
-        
-        try:
-            # if card_to_validate.effective_color == top_card_on_board.effective_color if top_card_on_board.effective_color is not None else top_card_on_board.color:
-            if card_to_validate.effective_color == top_card_on_board.effective_color:
-                if card_to_validate.can_execute_effect(self._game_context):
-                    return True     # Match by effective color
-            if card_to_validate.card_type == CardType.NUMBER:
-                if card_to_validate.card_value == top_card_on_board.card_value:
-                    return True     # Match by number
-            if card_to_validate.card_type in self._game_context.deck_config.WILD_CARDS:
-                if card_to_validate.can_execute_effect(self._game_context):
-                    return True     # Match by Wild Card (and effect is legal)
+
+        # The pure signature match reads only fixed card slots and cannot raise, so it
+        # runs outside the handler - no exception-frame setup on the no-match path
+        if not _is_signature_match(card_to_validate, card_to_validate.effective_color,
+                                   top_card_on_board, top_card_on_board.effective_color,
+                                   self._wild_types):
             return False            # No Match
+
+        try:
+            # Only the stateful effect check runs live and can actually fail
+            return card_to_validate.can_execute_effect(self._game_context, top_card_on_board)
         except AttributeError as e:
             print(f'Validation error: Incorect card attribute: {e}')
             return False
@@ -85,19 +125,24 @@ class GameEngine:
         # Remove Card
         current_player.hand.remove_card(card)
         
-        # Observer notification
-        event_data = {
-            'card': card,
-            'player': current_player,
-            'timestamp': datetime.now()
-        }
-
-        # FIX OBSERVER
-        self._game_context.notify_observers(GameEvent.CARD_PLAYED, event_data)
+        # Observer notification - skip payload construction when nobody subscribed.
+        # Primitives only: no live Card/Player refs end up retained in observer state,
+        # and the payload is directly JSON-serializable.
+        if self._game_context.has_observers(GameEvent.CARD_PLAYED):
+            event_data = {
+                'card_uid': card.card_id,
+                'card_repr': card.serialize(),
+                'player_id': current_player.player_id,
+                'player_name': current_player.name,
+                'seq': next(_event_seq)
+            }
+
+            # FIX OBSERVER
+            self._game_context.notify_observers(GameEvent.CARD_PLAYED, event_data)
 
     def check_win_condition(self, player: Player) -> None:
         """ Check for UNO and win condition. """
-        hand_size = len(player.hand.get_hand())
+        hand_size = len(player.hand)
         if hand_size == 1: # Check for UNO
             print(f"{player.name}: UNO!")
         if hand_size == 0: # Check win condition
@@ -105,10 +150,14 @@ class GameEngine:
             self._game_context.stop_game()
 
     def player_draw_card(self, player: Player, amount: int = 1) -> None:
-        """ Makes a player draw a card x times. """
-        cards_drawn = 0 
-        no_draw_error = True    # Dirty fix, ensures either error or succes is printed. 
-        
+        """ Makes a player draw a card x times.
+            Observers get one CARDS_DRAWN_BULK event for the whole draw rather than one
+            event per card - at deal time that collapses players x hand_size dispatches
+            (each with its own payload dict and datetime.now() call) into one each. """
+        cards_drawn = 0
+        no_draw_error = True    # Dirty fix, ensures either error or succes is printed.
+        drawn_cards: list[Card] = []
+
         for _ in range(amount):
             # Attempt to draw a card
             card = self._deck.draw_card()
@@ -117,21 +166,13 @@ class GameEngine:
                 card = self._handle_empty_deck_scenario()
             if card:
                 player.draw_card(card)
+                drawn_cards.append(card)
                 cards_drawn += 1
                 # if self._game_context.game_active:  # Dirty fix - prevents printing during game_context init
-                #     print(f"{player.name} took a {card}") 
+                #     print(f"{player.name} took a {card}")
                 if cards_drawn == amount:
-                        if no_draw_error and self._game_context.game_active:  
-                            print(f"* {player.name} took {cards_drawn} card(s)! *") 
-
-                # Logic for the observer
-                event_data = {
-                'card': card,                       # Actual Card object
-                'player': player,                   # Actual Player object
-                'timestamp': datetime.now()}
-
-                # Notify observer
-                self._game_context.notify_observers(GameEvent.CARD_DRAWN, event_data)
+                        if no_draw_error and self._game_context.game_active:
+                            print(f"* {player.name} took {cards_drawn} card(s)! *")
 
             else:
                 if cards_drawn < amount:
@@ -139,27 +180,40 @@ class GameEngine:
                     print(f"Warning: {player.name} could only draw {cards_drawn} of {amount} requested cards")
                     break
 
+        # Logic for the observer - one batched event, skip payload construction when
+        # nobody subscribed. Primitives only, mirroring CARD_PLAYED.
+        if drawn_cards and self._game_context.has_observers(GameEvent.CARDS_DRAWN_BULK):
+            event_data = {
+            'card_uids': [card.card_id for card in drawn_cards],
+            'card_reprs': [card.serialize() for card in drawn_cards],
+            'player_id': player.player_id,
+            'player_name': player.name,
+            'seq': next(_event_seq)}
+
+            # Notify observer
+            self._game_context.notify_observers(GameEvent.CARDS_DRAWN_BULK, event_data)
+
     def _handle_empty_deck_scenario(self) -> Card | None:
-        """ Handles empty deck scenario based on game rules. """
+        """ Handles empty deck scenario based on game rules.
+            Length pre-checks instead of try/except: draw_card already signals an empty
+            deck by returning None, so each strategy checks before drawing rather than
+            paying for a raised-and-discarded exception when recycling came up empty. """
 
         # Strategy 1: Try deck recycling
         if self._deck.get_deck_length() == 0:
             self._deck.attempt_recycle_deck(self._board)
-        try:
+        if self._deck.get_deck_length() > 0:
             return self._deck.draw_card()
-        except IndexError:
-            pass
 
         # Strategy 2: Check multiple deck rule
         if self._game_context.rules.ALLOW_MULTIPLE_DECKS:
             print("Adding another deck of cards..")
-            try:
-                DeckBuilder.populate_deck(self._game_context.deck_config, self._deck)
+            DeckBuilder.populate_deck(self._game_context.deck_config, self._deck)
+            if self._deck.get_deck_length() > 0:
                 print("New deck added..")
                 return self._deck.draw_card()
-            except IndexError:
-                print("Failed to create deck/grab a card..")
-                return None
-                    
+            print("Failed to create deck/grab a card..")
+            return None
+
         print("No cards are available to draw..")
         return None
\ No newline at end of file
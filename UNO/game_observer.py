@@ -1,30 +1,59 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any, TYPE_CHECKING
+from __future__ import annotations
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Any, Protocol, TYPE_CHECKING
 from datetime import datetime
 from UNO.game_constants import GameEvent as Event
-from UNO.player import Player
-from UNO.card import Card
 
+# Annotation-only imports: with lazy annotations these classes are never needed at
+# runtime here, so the modules stay off this module's import path
 if TYPE_CHECKING:
-    from UNO.game import Game 
+    from UNO.player import Player
+    from UNO.card import Card
+    from UNO.game import Game
 
-class GameObserver(ABC):
-    """ Observer abstract class for the game. 
-        Mostly used for managing game states and for in the future, saving/restoring games and perhaps offering a small multiplayer version.  """
+# Flat serialized card form: one 3-slot tuple per unique card instead of two nested
+# dicts. The nested-dict shape the snapshot consumers expect is rebuilt on demand.
+CardRepr = namedtuple('CardRepr', 'color card_type card_value')
+
+# Memoized CardRepr factory: duplicate cards carry distinct card_ids but identical
+# faces (e.g. the two Red 5s), so the table entries share one tuple per unique face.
+# Pure value construction, safe to cache across sessions.
+_make_card_repr = lru_cache(maxsize=512)(CardRepr)
+
+class GameObserver(Protocol):
+    """ Observer protocol for the game.
+        Mostly used for managing game states and for in the future, saving/restoring games and perhaps offering a small multiplayer version.
+        Structural (duck-typed): anything defining on_game_event qualifies - no ABC
+        registration or subclass machinery needed.  """
 
-    @abstractmethod
     def on_game_event(self, event: Event, data: Dict[str, Any]) -> None:
         """ React to game state changes. """
-        pass
+        ...
+
+class GameContext:
+    """ OBSERVER: Context Manager for the Game.
 
-class GameContext(GameObserver):
-    """ OBSERVER: Context Manager for the Game. 
-        
         Current & future design:
         This observer now notes and saves all game context related actions, so that in the future this can be used to pause and restore games.
         The saving functionality is already working mostly, as all data is beign serialized in the snapshots, it just needs a method to log it into a file.
+
+        Data model:
+        Per-event updates are O(1) deltas. Each unique card is serialized once into
+        _card_table (keyed by card_id); the live snapshots only hold card_id -> count
+        bags. Counts (not plain membership) because flyweighted duplicates share one
+        card_id. get_complete_snapshot joins the bags against the table on demand,
+        so no nested dicts are allocated - and no O(N) list.remove equality walks
+        run - while the game is being played.
         """
-    
+
+    # Fixed attribute set - no per-instance __dict__. '__weakref__' stays in: the
+    # publishers hold this observer in WeakSets, which need weak-referenceability.
+    __slots__ = ('game', '_rule_snapshot', '_deck_config_snapshot', '_players_snapshot',
+                 '_card_table', '_topcard_id', '_hand_by_pid', '_deck_snapshot',
+                 '_board_snapshot', '_current_player_snapshot', '_turn_order_snapshot',
+                 '_last_updated', '_handlers', '__weakref__')
+
     def __init__(self, game: 'Game'):
         self.game = game # Dirty scoping, needs proper fix
 
@@ -33,165 +62,198 @@ class GameContext(GameObserver):
         self._deck_config_snapshot = game.deck_config # Not proper serialization, but for now assumes deck configuration classes stays the same.
         self._players_snapshot = {player.player_id: {'name': player.name,'is_human': player.is_human_controlled()}
                                    for player in game.players} # Doesnt work with leaving players, needs fixing for a potential future multiplayer
-        
-        # Empty dynamic snapshots
-        self._topcard_snapshot = {} # Same value as deck_snapshot[-1] but kept for easy-of-use
-        self._hand_per_player_snapshot = {}
+
+        # Serialized card forms (flat CardRepr tuples), interned once per unique card_id
+        self._card_table: Dict[int, CardRepr] = {}
+
+        # Empty dynamic snapshots (card_id -> count bags; see class docstring).
+        # Hands are keyed by player_id: int hashing beats string hashing per event,
+        # and duplicate player names cannot alias each other's hands.
+        self._topcard_id = None # Same value as the last board card but kept for easy-of-use
+        self._hand_by_pid = {}
         self._deck_snapshot = {}
         self._board_snapshot = {}
         self._current_player_snapshot = {}
         self._turn_order_snapshot = {}
         self._last_updated = datetime.now()
 
-        # Subscribe to game events
-        self.game.subscribe(self)
-        self.game.board.subscribe(self)
-        self.game.deck.subscribe(self)
+        # Event -> handler dispatch table: one dict lookup per event instead of an
+        # if/elif chain. PLAYER_TURN_CHANGED / TURN_ORDER_CHANGED are simply not
+        # installed until they are implemented.
+        self._handlers = {
+            Event.CARD_DRAWN: self._on_card_drawn,
+            Event.CARDS_DRAWN_BULK: self._on_cards_drawn_bulk,
+            Event.CARD_PLAYED: self._on_card_played,
+            Event.ADD_CARD_TO_BOARD: self._on_card_added_to_board,
+            Event.BOARD_CLEARED: self._on_board_cleared,
+            Event.ADD_CARD_TO_DECK: self._on_card_added_to_deck,
+        }
+
+        # Subscribe to game events - only for the events this observer handles, so
+        # publishers never dispatch turn-change or deck-removal traffic here
+        self.game.subscribe(self, events={Event.CARD_DRAWN, Event.CARDS_DRAWN_BULK, Event.CARD_PLAYED})
+        self.game.board.subscribe(self, events={Event.ADD_CARD_TO_BOARD, Event.BOARD_CLEARED})
+        self.game.deck.subscribe(self, events={Event.ADD_CARD_TO_DECK})
 
     def on_game_event(self, event: Event, data: Dict[str, Any]) -> None:
         """ When event XYZ happens, fire off the proper method. """
-        if event == Event.CARD_DRAWN:
-            self._update_player_held_cards(data['card'], data['player'], event)
-            # self._update_deck()
+        handler = self._handlers.get(event)
+        if handler is not None:
+            handler(data)
+
+    # ==== Per-event handlers (unpack the payload, delegate to the _update_* helpers) ====
+
+    def _on_card_drawn(self, data: Dict[str, Any]) -> None:
+        # Legacy single-card form still carrying a live Card (no current publisher)
+        card_id = self._intern_card(data['card'])
+        self._update_player_held_cards(card_id, data['player'].player_id, Event.CARD_DRAWN)
+        # self._update_deck()
+
+    def _on_cards_drawn_bulk(self, data: Dict[str, Any]) -> None:
+        """ Batched form of CARD_DRAWN: one event carries every card of a multi-draw. """
+        player_id = data['player_id']
+        for card_uid, card_repr in zip(data['card_uids'], data['card_reprs']):
+            self._intern_repr(card_uid, card_repr)
+            self._update_player_held_cards(card_uid, player_id, Event.CARD_DRAWN)
+
+    def _on_card_played(self, data: Dict[str, Any]) -> None:
+        card_uid = data['card_uid']
+        self._intern_repr(card_uid, data['card_repr'])
+        self._update_player_held_cards(card_uid, data['player_id'], Event.CARD_PLAYED)
+        self._update_deck_remove_card(card_uid)
 
-        elif event == Event.CARD_PLAYED:
-            self._update_player_held_cards(data['card'], data['player'], event)
-            self._update_deck_remove_card(data['card'])
+    def _on_card_added_to_board(self, data: Dict[str, Any]) -> None:
+        self._update_top_card(data['card'])
+        self._update_board_add_card(data['card'])
 
-        elif event == Event.PLAYER_TURN_CHANGED:
-            # Yet to implement
-            pass
-        
-        elif event == Event.TURN_ORDER_CHANGED:
-            # Yet to implement
-            pass
+    def _on_board_cleared(self, data: Dict[str, Any]) -> None:
+        self._update_board_after_clearing(data['board_cards'])
 
-        elif event == Event.ADD_CARD_TO_BOARD:
-            self._update_top_card(data['card'])
-            self._update_board_add_card(data['card'])
+    def _on_card_added_to_deck(self, data: Dict[str, Any]) -> None:
+        self._update_deck_add_card(data['card'])
 
-        elif event == Event.BOARD_CLEARED:
-            self._update_board_after_clearing(data['board'])
+    def _intern_card(self, card: Card) -> int:
+        """ Ensure the card's serialized form is in the table once; returns its card_id. """
+        card_id = card.card_id
+        if card_id not in self._card_table:
+            self._card_table[card_id] = _make_card_repr(
+                card.color.value,           # Enum to string
+                card.card_type.value,       # Enum to string
+                card.card_value)            # Int
+        return card_id
 
-        elif event == Event.ADD_CARD_TO_DECK:
-            self._update_deck_add_card(data['card'])
+    def _intern_repr(self, card_uid: int, card_repr: tuple) -> None:
+        """ Intern an already-serialized (color, card_type, card_value) tuple by uid. """
+        if card_uid not in self._card_table:
+            self._card_table[card_uid] = _make_card_repr(*card_repr)
+
+    @staticmethod
+    def _expand_card(card_repr: CardRepr) -> Dict[str, Any]:
+        """ Rebuild the nested card_data dict shape consumers of the snapshot expect. """
+        return {
+            'card_type': card_repr.card_type,
+            'card_data': {
+                'color': card_repr.color,
+                'card_type': card_repr.card_type,
+                'card_value': card_repr.card_value
+                }
+        }
+
+    @staticmethod
+    def _bag_add(bag: Dict[int, int], card_id: int) -> None:
+        """ Add one occurrence of a card to a count bag. """
+        bag[card_id] = bag.get(card_id, 0) + 1
+
+    @staticmethod
+    def _bag_remove(bag: Dict[int, int], card_id: int) -> None:
+        """ Remove one occurrence of a card from a count bag. """
+        count = bag.get(card_id, 0)
+        if count <= 1:
+            bag.pop(card_id, None)
+        else:
+            bag[card_id] = count - 1
 
     def _update_turn_order(self):
         # Yet to implement
         pass
-    
-    
+
+
     def _update_current_player_turn(self, player: Player):
         # Yet to implement
         pass
 
-    def _update_deck_remove_card(self, card: Card) -> None:
+    def _update_deck_remove_card(self, card_uid: int) -> None:
         """ Update deck by removing a single card. """
-       # Store card data as a dictionary
-        card_data = {
-            'card_type': card.card_type.value,
-            'card_data': {
-                'color': card.color.value,                      # Enum to string
-                'card_type': card.card_type.value,              # Enum to string
-                'card_value': card.card_value                   # Int
-                }                  
-        }
+        self._bag_remove(self._deck_snapshot, card_uid)
 
-        self._deck_snapshot['deck_cards'].remove(card_data)
-        
     # DOESNT WORK WITH SHUFFLE YET! DOESNT ADJUST THE ORDER BASED IN SHUFFLE.
     # Would like to preserve the order of the deck, so shuffled state needs to be added here
     def _update_deck_add_card(self, card: Card) -> None:
         """ Update deck snapshot with new card. """
-        # Store card data as a dictionary
-        card_data = {
-            'card_type': card.card_type.value,
-            'card_data': {
-                'color': card.color.value,                      # Enum to string
-                'card_type': card.card_type.value,              # Enum to string
-                'card_value': card.card_value                   # Int
-                }                  
-        }
-        if 'deck_cards' not in self._deck_snapshot:
-            self._deck_snapshot['deck_cards'] = []
-        self._deck_snapshot['deck_cards'].append(card_data)
+        self._bag_add(self._deck_snapshot, self._intern_card(card))
 
-    def _update_player_held_cards(self, card: Card, player: Player, event: Event) -> None:
+    def _update_player_held_cards(self, card_uid: int, player_id: int, event: Event) -> None:
         """ Update card to individual player snapshot with played card. Adds the player if first call. """
 
         # Add player to the list
-        if player.name not in self._hand_per_player_snapshot:
-            self._hand_per_player_snapshot[player.name] = []
-
-        # Store card data as a dictionary
-        card_data = {
-            'card_type': card.card_type.value,
-            'card_data': {
-                'color': card.color.value,                      # Enum to string
-                'card_type': card.card_type.value,              # Enum to string
-                'card_value': card.card_value                   # Int
-                }                  
-        }
+        hand_bag = self._hand_by_pid.get(player_id)
+        if hand_bag is None:
+            hand_bag = self._hand_by_pid[player_id] = {}
 
         # Add card to the snapshot
         if event is Event.CARD_DRAWN:
-            self._hand_per_player_snapshot[player.name].append(card_data)
+            self._bag_add(hand_bag, card_uid)
         # Remove card from snapshot
         if event is Event.CARD_PLAYED:
-            self._hand_per_player_snapshot[player.name].remove(card_data)
+            self._bag_remove(hand_bag, card_uid)
 
-    def _update_board_after_clearing(self, board: dict[str, Card]) -> None:
-        """ Update board snapshot after clearing. """
+    def _update_board_after_clearing(self, remaining_cards: list) -> None:
+        """ Update board snapshot after clearing: only the passed cards remain. """
         self._board_snapshot = {}
-        self._board_snapshot = board
-   
+        for card in remaining_cards:
+            self._bag_add(self._board_snapshot, self._intern_card(card))
+
     def _update_board_add_card(self, card: Card) -> None:
         """ Update board after card gets played. """
-        card_data = {
-            'card_type': card.card_type.value,
-            'card_data': {
-                'color': card.color.value,                      # Enum to string
-                'card_type': card.card_type.value,              # Enum to string
-                'card_value': card.card_value                   # Int
-                }
-            }    
-
-        if 'board_cards' not in self._board_snapshot:
-            self._board_snapshot['board_cards'] = []
-        self._board_snapshot['board_cards'].append(card_data)
+        self._bag_add(self._board_snapshot, self._intern_card(card))
 
     def _update_top_card(self, card: Card) -> None:
-        """ Update game context with last played card (on board). 
+        """ Update game context with last played card (on board).
             While this can be inferred from the whole board[-1], it's kept for ease of use. """
+        self._topcard_id = self._intern_card(card)
 
-        card_data = {
-            'card_type': card.card_type.value,
-            'card_data': {
-                'color': card.color.value,                      # Enum to string
-                'card_type': card.card_type.value,              # Enum to string
-                'card_value': card.card_value                   # Int
-            }
-        }
+    def _materialize_bag(self, bag: Dict[int, int]) -> list:
+        """ Expand a card_id -> count bag into the serializable list-of-dicts form.
+            Each unique card is expanded once; duplicates share the expanded dict. """
+        card_table = self._card_table
+        expand = self._expand_card
+        materialized = []
+        for card_id, count in bag.items():
+            card_data = expand(card_table[card_id])
+            materialized.extend(card_data for _ in range(count))
+        return materialized
 
-        self._topcard_snapshot['top_card'] = card_data
-   
     def get_complete_snapshot(self) -> Dict[str, Any]:
-        """ Get complete serializable snapshot for save/load. """
+        """ Get complete serializable snapshot for save/load.
+            This is where the interned card forms are joined back in - the only
+            place paying for full materialization. """
         return {
             'rules': self._rule_snapshot,
             'deck_config': self._deck_config_snapshot,
             'players': self._players_snapshot,
-            'top_card': self._topcard_snapshot,
-            'player_hands': self._hand_per_player_snapshot,
-            'deck': self._deck_snapshot,
-            'board': self._board_snapshot,
+            'top_card': {'top_card': self._expand_card(self._card_table[self._topcard_id])} if self._topcard_id is not None else {},
+            'player_hands': {self._players_snapshot[player_id]['name']: self._materialize_bag(bag)
+                             for player_id, bag in self._hand_by_pid.items()},
+            'deck': {'deck_cards': self._materialize_bag(self._deck_snapshot)},
+            'board': {'board_cards': self._materialize_bag(self._board_snapshot)},
             'last_updated': self._last_updated.isoformat()
         }
 
     def print_complete_snapshot(self) -> None:
-        """ Temporarily method: Prints the complete snapshot. 
-            Purely for testing/demonstrtation purposes. 
+        """ Temporarily method: Prints the complete snapshot.
+            Purely for testing/demonstrtation purposes.
             In the future, this will be a method that dumps the snapshot to a JSON for example. """
         serialized_snapshot = self.get_complete_snapshot()
-        for data, values in serialized_snapshot.items():
-            print(f"TOPIC: {data} \n ----- \n {values}\n\n")
+        # Single write for the whole dump instead of one locked/flushed print per topic
+        print("".join(f"TOPIC: {data} \n ----- \n {values}\n\n\n"
+                      for data, values in serialized_snapshot.items()), end="")
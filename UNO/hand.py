@@ -1,39 +1,74 @@
 from UNO.card import Card
+from UNO.game_constants import Color, COLOR_INDEX, PLAYABLE_COLORS
 
 class Hand():
     """ Hand class, used as a composition within the Player class.
-        Represents the cards held by a player. 
-        
-        Args: 
-        - cards: A protected attribute for holding all player cards. """
+        Represents the cards held by a player.
+
+        Args:
+        - cards: A protected attribute for holding all player cards.
+        - color_counts: A running bincount of held (non-colorless) colors indexed via
+          COLOR_INDEX, kept in sync by add_card/remove_card so color preference reads
+          are O(1) without hashing enum members.
+
+        Storage is deliberately a plain list. Cards define no __eq__, so list.remove
+        short-circuits on identity at C speed - over a <=20 card hand that beats any
+        constant-factor bookkeeping. A dict keyed by id(card) would be unsafe here:
+        flyweighted duplicates share one instance, so two copies of the same card
+        would collapse into a single entry. And select_card needs O(1) index access,
+        which a deque gives up. """
+
+    # Fixed attribute set: no per-instance __dict__, slot access beats dict lookup
+    __slots__ = ('_cards', '_color_counts')
 
     def __init__(self):
         self._cards = []
+        self._color_counts: list[int] = [0, 0, 0, 0]
 
     def add_card(self, card: Card) -> None:
         """ Add card to hand. """
         self._cards.append(card)
+        index = COLOR_INDEX.get(card.color)
+        if index is not None:
+            self._color_counts[index] += 1
 
     def show_hand(self) -> str:
         """ Returns a formatted hand string - CLI display method. """
         if not self._cards:
             return "Hand is empty"
-        
-        lines = []
-        for index, card in enumerate(self._cards):
-            lines.append(f"{index}: {card}")
-        return "\n".join(lines)
+
+        # Single join over a generator; each card's line comes from its __str__ memo
+        return "\n".join(f"{index}: {card}" for index, card in enumerate(self._cards))
 
     def get_hand(self) -> list:
         """ Returns a copy of player's hand. Preserves integrity of original. """
         return self._cards.copy()
-    
+
+    def iter_hand(self):
+        """ Read-only iteration over the hand, without the defensive copy of get_hand. """
+        return iter(self._cards)
+
+    def __len__(self) -> int:
+        """ Number of cards held, without copying or formatting the hand. """
+        return len(self._cards)
+
     def remove_card(self, card: Card) -> None:
         """ Remove specific card from hand. """
         self._cards.remove(card)
+        index = COLOR_INDEX.get(card.color)
+        if index is not None:
+            self._color_counts[index] -= 1
+
+    def most_common_color(self) -> Color | None:
+        """ Returns the most held color, or None when only wild cards (or nothing) are held. """
+        counts = self._color_counts
+        best_index = max(range(4), key=counts.__getitem__)
+        if counts[best_index] > 0:
+            return PLAYABLE_COLORS[best_index]
+        return None
 
     def select_card(self, user_input: int) -> Card | None:
-        """ Select a card from player's Hand. 
+        """ Select a card from player's Hand.
             Returns None when retrieval failed.  """
         card_selection = None
         try:
@@ -42,8 +77,7 @@ class Hand():
             print(f'Not a valid index number, try again. Error: {e}')
         except ValueError as e:
             print(f'Not a valid value provided, try again. Error: {e}')
-        except Exception as e: 
+        except Exception as e:
             print(f'A generic error occured, try again. Error: {e}')
 
         return card_selection
-    
\ No newline at end of file
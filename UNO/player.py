@@ -3,6 +3,8 @@ from UNO.hand import Hand
 
 class Player():
     """ Player class. """
+    __slots__ = ('name', 'hand', 'player_id', '_is_human')
+
     _unique_player_id = 1 # Class variable to keep track of unique player IDs
 
     def __init__(self, name, is_human: Optional[bool] = True):
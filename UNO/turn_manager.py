@@ -1,22 +1,27 @@
+from weakref import WeakSet
 from UNO.player import Player
 from UNO.game_constants import GameEvent
 
 class TurnManager():
     """ Turn manager abstracts turn logic for the game class. """
-    
+
+    # Fixed attribute set - no per-instance __dict__, and typos on assignment fail loudly
+    __slots__ = ('_players', '_current', '_observers', '_step', '_player_count')
+
     def __init__(self, players: list) -> None:
         self._players = players
         self._current = 0 # use dictionary later for better turn management...
-        self._observers = []
-        self._clockwise = True
-    
+        # Per-event observer buckets (GameEvent -> WeakSet); see Deck for rationale
+        self._observers = {}
+        # Direction as a signed step (+1 clockwise, -1 counter-clockwise): advancing a
+        # turn becomes one branchless modular add. Player count is cached - the player
+        # list never changes mid-game.
+        self._step = 1
+        self._player_count = len(players)
+
     def get_next_player(self) -> Player:
         """ Controlled access to next player. """
-        if self._clockwise is True:
-            next_player = (self._current + 1) % len(self._players)
-        else:
-            next_player = (self._current - 1) % len(self._players)
-        return self._players[next_player]
+        return self._players[(self._current + self._step) % self._player_count]
     
     # def start_turn(self):
     #     # Apply post-turn or targeted (?) effects
@@ -34,25 +39,20 @@ class TurnManager():
 
     def end_turn(self) -> None:
         """ End player's turn. """
-        if self._clockwise is True:
-            self._current = (self._current + 1) % len(self._players)
-        else:
-            self._current = (self._current - 1) % len(self._players)
+        self._current = (self._current + self._step) % self._player_count
 
-        # Observer logic
-        current_player = self.get_current_player
-        self.notify_observers(GameEvent.PLAYER_TURN_CHANGED, {'player': current_player})
+        # Observer logic - skip payload construction when nobody subscribed
+        if self._observers.get(GameEvent.PLAYER_TURN_CHANGED):
+            current_player = self.get_current_player()
+            self.notify_observers(GameEvent.PLAYER_TURN_CHANGED, {'player': current_player})
 
     def reverse_play_order(self) -> None:
         """ Reverse the play order. """
-        if self._clockwise is True:
-            self._clockwise = False
-        else:
-            self._clockwise = True
+        self._step = -self._step
 
-        # Observer logic
-        turn_order = self._clockwise
-        self.notify_observers(GameEvent.TURN_ORDER_CHANGED, {'turn_order': turn_order})
+        # Observer logic - skip payload construction when nobody subscribed
+        if self._observers.get(GameEvent.TURN_ORDER_CHANGED):
+            self.notify_observers(GameEvent.TURN_ORDER_CHANGED, {'turn_order': self._step > 0})
 
     def skip_turn(self) -> None:
         """ Skip the next player.
@@ -60,12 +60,14 @@ class TurnManager():
             - This mechanic will be refactored when refactoring the game loop.  """
         self.end_turn()
 
-    def subscribe(self, observer):
-        """ Subscribe as a observer. """
-        self._observers.append(observer)
+    def subscribe(self, observer, events=None):
+        """ Subscribe as a observer, optionally for a specific set of events only.
+            Set semantics make repeat subscriptions idempotent - no double-fired events. """
+        for event in (events if events is not None else GameEvent):
+            self._observers.setdefault(event, WeakSet()).add(observer)
 
     def notify_observers(self, event, data):
         """ Notify all subscribed observers. """
-        for observer in self._observers:
+        for observer in tuple(self._observers.get(event, ())):
             observer.on_game_event(event, data)
 
@@ -2,16 +2,20 @@ from UNO.game_constants import Color
 
 class UserInput:
     """ Utility class for getting user input. """
-    
+
+    # Built once at class creation: the selectable colors never change, and neither
+    # does the menu printed for them (one write instead of a print per color)
+    _SELECTABLE_COLORS: tuple[Color, ...] = tuple(color for color in Color if color is not Color.COLORLESS)
+    _COLOR_MENU: str = "Choose color:\n" + "\n".join(
+        f"[{i}] {color.value}" for i, color in enumerate(_SELECTABLE_COLORS, 1))
+
     @staticmethod
     def get_color_selection() -> Color:
         """Shared color selection logic"""
-        selectable_colors = [color for color in Color if color != Color.COLORLESS]
-        
-        print("Choose color:")
-        for i, color in enumerate(selectable_colors, 1):
-            print(f"[{i}] {color.value}")
-        
+        selectable_colors = UserInput._SELECTABLE_COLORS
+
+        print(UserInput._COLOR_MENU)
+
         try:
             choice = int(input("Selection: ")) - 1
             if 0 <= choice < len(selectable_colors):